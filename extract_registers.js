@@ -63,6 +63,8 @@ for (const [k, v] of pdus.entries()) {
   entry.messages = entry.messages.filter((x, i, a) => i === a.findIndex(y => JSON.stringify(y) === JSON.stringify(x)));
   out.push(entry);
 }
+// Emit in address order so consumers can iterate without re-sorting
+out.sort((a, b) => a.pdu - b.pdu);
 
 // Also include labels (a subset) to help mapping later
 const result = {
@@ -5,6 +5,7 @@ and generate per-language label modules for the ESPHome custom component.
 
 Writes:
 - `components/immergas_modbus/immergas/labels_<lang>.py` for each language
+- `components/immergas_modbus/immergas/labels_<lang>.json` (same mapping, for tools)
 - `immergas_registers.json` (compact PDU list)
 
 Run from the `Immergas-Modbus` directory:
@@ -117,6 +118,12 @@ def generate_label_modules(lbl_json: dict):
                 f.write(f'    {key}: {{"text1": {text1}, "text2": {text2}, "action": {action}, "comment": {comment}}},\n')
             f.write('}\n')
         generated.append(str(mod_path))
+
+        # write json data file (JSON keys are strings; readers convert numeric codes back)
+        json_path = LABELS_DIR / f'labels_{lang}.json'
+        with json_path.open('w', encoding='utf8') as f:
+            json.dump(mapping, f, indent=2, ensure_ascii=False)
+        generated.append(str(json_path))
     return generated
 
 
@@ -147,6 +154,9 @@ def main():
         entry['messages'] = dedupe_list(entry['messages'])
         out.append(entry)
 
+    # emit in address order so consumers can iterate without re-sorting
+    out.sort(key=lambda e: e['pdu'])
+
     result = {
         'generated_at': __import__('datetime').datetime.utcnow().isoformat() + 'Z',
         'source_cfg': str(CFG_PATH),
@@ -0,0 +1,97 @@
+"""Bulk decode backends must agree with each other and with decode_view()."""
+
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from tools import lookup_register as lr  # noqa: E402
+
+RAWS = (0x0000, 0x0001, 0x007F, 0x0080, 0x00FF, 0x0100, 0x7FFF, 0x8000, 0xFFF6, 0xFFFF)
+
+
+# View shapes the current registry does not use, so every kernel is exercised
+SYNTHETIC_VIEWS = [
+    {"item": "t-s16", "return": ["s16"]},
+    {"item": "t-u8", "return": ["u8"]},
+    {"item": "t-hb", "return": ["HB", "flag8", "3"]},
+    {"item": "t-check-hb", "check": {"data": ["HB", "flag8", "1"], "match": ["0"]}},
+    {"item": "t-temp0", "return": ["temp"], "decimal": 0},
+    {"item": "t-temp2", "return": ["temp"], "decimal": 2},
+]
+
+
+@pytest.fixture(scope="module")
+def views():
+    data = lr.load_registry()
+    return [v for p in data["pdus"] for v in p.get("views", ())] + SYNTHETIC_VIEWS
+
+
+def _frame(raws):
+    return struct.pack(f">{len(raws)}H", *raws)
+
+
+def _assert_matches_decode_view(view, raw, value):
+    """The numeric value must be what decode_view() prints for this raw."""
+    text = lr.decode_view(view, raw)
+    kind = lr.view_kind(view)
+    if kind == "temp":
+        token = f": {lr._temp_scale(view)[1].format(value)} °C"
+    elif kind in ("LB", "HB", "check"):
+        token = f"= {int(value)}"
+    else:
+        token = f": {int(value)}  ("
+    assert token in text, (view, raw, value, text)
+
+
+@pytest.mark.parametrize("raw", RAWS)
+def test_struct_backend_matches_decode_view(views, raw):
+    raws = [raw] * len(views)
+    values = lr.decode_many_struct(views, raws)
+    assert values == lr.decode_many_struct(views, _frame(raws))
+    for view, value in zip(views, values):
+        _assert_matches_decode_view(view, raw, value)
+
+
+@pytest.mark.parametrize("raw", RAWS)
+def test_numpy_backend_matches_struct_backend(views, raw):
+    np = pytest.importorskip("numpy")
+    raws = [raw] * len(views)
+    values = lr.decode_many(views, np.array(raws, dtype=np.uint16))
+    assert isinstance(values, np.ndarray)
+    assert values.tolist() == lr.decode_many_struct(views, raws)
+    assert lr.decode_many(views, _frame(raws)).tolist() == values.tolist()
+
+
+def test_mixed_raws_agree(views):
+    np = pytest.importorskip("numpy")
+    raws = [RAWS[i % len(RAWS)] for i in range(len(views))]
+    assert lr.decode_many(views, raws).tolist() == lr.decode_many_struct(views, raws)
+
+
+def test_odd_length_frame_rejected(views):
+    with pytest.raises(ValueError):
+        lr.unpack_registers(b"\x00\x01\x02")
+    with pytest.raises(ValueError):
+        lr.decode_many_struct(views[:2], b"\x00\x01\x02")
+
+
+def test_odd_length_frame_rejected_numpy(views):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        lr.decode_many(views[:2], b"\x00\x01\x02")
+
+
+def test_length_mismatch_rejected(views):
+    with pytest.raises(ValueError):
+        lr.decode_many_struct(views[:3], [0, 1])
+
+
+def test_length_mismatch_rejected_numpy(views):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        lr.decode_many(views[:3], [0, 1])
@@ -0,0 +1,35 @@
+"""
+Numeric kernels for bulk register decoding (used by lookup_register.decode_many).
+
+Kept in their own module so the JIT import/compile cost is only paid by bulk
+callers, never by the single-value CLI path. With Numba installed the kernels
+are compiled with ``@njit(cache=True, fastmath=True)``; without it they run as
+plain NumPy vector expressions. String formatting stays in Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def _decode_s16_array(raws):
+    """uint16[:] -> int64[:] two's-complement sign extension."""
+    return (raws.astype(np.int64) ^ 0x8000) - 0x8000
+
+
+@njit(cache=True, fastmath=True)
+def _decode_temp_array(raws, scales):
+    """uint16[:], float64[:] -> float64[:] scaled temperatures."""
+    return raws.astype(np.float64) * scales
+
+
+@njit(cache=True, fastmath=True)
+def _decode_flag8_array(raws, shifts, bits):
+    """uint16[:], int64[:], int64[:] -> int64[:] selected bit of the LB/HB byte."""
+    return (((raws.astype(np.int64) >> shifts) & 0xFF) >> bits) & 1
@@ -17,8 +17,11 @@ Run from the Immergas-Modbus directory.
 """
 
 import argparse
+import functools
 import json
 import sys
+from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -26,114 +29,363 @@ JSON_PATH = ROOT / "immergas_registers.json"
 LABELS_DIR = ROOT / "components" / "immergas_modbus" / "immergas"
 
 
+# ---------------------------------------------------------------------------
+# Registry loading
+# ---------------------------------------------------------------------------
+
+def load_registry() -> dict:
+    """Parse immergas_registers.json, with PDUs in address order."""
+    data = json.loads(JSON_PATH.read_bytes())
+    # The extractors emit PDUs in address order; sort here in case the JSON predates that
+    pdus = data.get("pdus", [])
+    if any(a["pdu"] > b["pdu"] for a, b in zip(pdus, pdus[1:])):
+        pdus.sort(key=lambda p: p["pdu"])
+    return data
+
+
 # ---------------------------------------------------------------------------
 # Label loading
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
 def load_labels(lang: str = "en") -> dict:
-    """Import a generated labels_<lang>.py module and return the mapping dict."""
+    """Load the generated labels_<lang>.json data file and return the mapping dict.
+
+    Falls back to importing labels_<lang>.py when no JSON file was generated.
+    """
+    json_path = LABELS_DIR / f"labels_{lang}.json"
+    if json_path.exists():
+        # JSON object keys are strings; fault codes are ints in the label modules
+        labels = {}
+        for k, v in json.loads(json_path.read_bytes()).items():
+            try:
+                k = int(k)
+            except ValueError:
+                pass  # e.g. "default"
+            labels[k] = v
+        return labels
+
     mod_path = LABELS_DIR / f"labels_{lang}.py"
     if not mod_path.exists():
         return {}
-    ns: dict = {}
-    exec(mod_path.read_text(encoding="utf8"), ns)  # noqa: S102
-    return ns.get("immergas_labels", {})
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(f"immergas_labels_{lang}", mod_path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return getattr(mod, "immergas_labels", {})
 
 
 # ---------------------------------------------------------------------------
 # View decoding helpers
 # ---------------------------------------------------------------------------
+#
+# A view's shape (return type, decimals, byte/bit selector) is fixed, so a
+# view is compiled into a closure over those constants the first time it is
+# decoded; later decodes of that view are a single call.
 
-def _low_byte(raw: int) -> int:
-    return raw & 0xFF
+Decoder = Callable[[int], str]
 
 
-def _high_byte(raw: int) -> int:
-    return (raw >> 8) & 0xFF
+def _compile_u16(view: dict, item: str) -> Decoder:
+    def decode(raw: int) -> str:
+        return f"{item}: {raw}  (u16)"
+    return decode
 
 
-def _bit(byte_val: int, bit_index: int) -> int:
-    return (byte_val >> bit_index) & 1
+def _compile_s16(view: dict, item: str) -> Decoder:
+    def decode(raw: int) -> str:
+        return f"{item}: {(raw ^ 0x8000) - 0x8000}  (s16)"  # two's-complement sign extension
+    return decode
 
 
-def decode_view(view: dict, raw: int) -> str:
-    """Decode a single view entry against a raw u16 Modbus register value."""
-    ret = view.get("return")
-    check = view.get("check")
-    item = view.get("item", "?")
+def _compile_u8(view: dict, item: str) -> Decoder:
+    def decode(raw: int) -> str:
+        return f"{item}: {raw & 0xFF}  (u8)"
+    return decode
+
+
+# Precomputed 10**-n scales and matching format strings for the "decimal" field
+_SCALES = tuple(10 ** -i for i in range(6))
+_FMTS = tuple(f"{{:.{i}f}}" for i in range(6))
+
+
+def _temp_scale(view: dict) -> tuple[float, str]:
+    """Return (scale, format string) for a temp view's "decimal" field."""
+    d = int(view.get("decimal", 1))
+    if 0 <= d < len(_SCALES):
+        return _SCALES[d], _FMTS[d]
+    return 10 ** -d, f"{{:.{max(d, 0)}f}}"
+
+
+def _bit_select(view: dict, kind: str) -> tuple[str, int, int]:
+    """Return (byte name, byte shift, bit index) for an LB/HB/check flag8 view."""
+    data = view["check"]["data"] if kind == "check" else view["return"]
+    sel = "LB" if data[0] == "LB" else "HB"
+    return sel, (0 if sel == "LB" else 8), int(data[2])
+
 
-    # ---- flag8 / bit check (used for boolean items) ----------------------
+def _compile_temp(view: dict, item: str) -> Decoder:
+    scale, fmt = _temp_scale(view)
+    fmt = fmt.format
+    suffix = f" °C  (temp, ×{scale})"
+
+    def decode(raw: int) -> str:
+        return f"{item}: {fmt(raw * scale)}{suffix}"
+    return decode
+
+
+def _compile_flag8(view: dict, item: str) -> Decoder:
+    sel, shift, bit_idx = _bit_select(view, "flag8")
+
+    def decode(raw: int) -> str:
+        return f"{item}: bit {bit_idx} of {sel} = {(((raw >> shift) & 0xFF) >> bit_idx) & 1}"
+    return decode
+
+
+def _compile_check(view: dict, item: str) -> Decoder:
+    sel, shift, bit_idx = _bit_select(view, "check")
+    match_vals = view["check"].get("match", [])
+    on = view.get("value", ["1"])
+    off = view.get("else-value", ["0"])
+
+    def decode(raw: int) -> str:
+        actual = str((((raw >> shift) & 0xFF) >> bit_idx) & 1)
+        result = on[0] if actual in match_vals else off[0]
+        return f"{item}: {result}  (bit {bit_idx} of {sel} = {actual})"
+    return decode
+
+
+def _compile_raw(view: dict, item: str) -> Decoder:
+    def decode(raw: int) -> str:
+        return f"{item}: {raw}  (raw u16)"
+    return decode
+
+
+def view_kind(view: dict) -> str:
+    """Classify a view as "check", one of the return tags in _COMPILERS, or "raw"."""
+    check = view.get("check")
     if check:
         data = check.get("data", [])
-        match_vals = check.get("match", [])
         if len(data) == 3 and data[1] == "flag8":
-            byte_sel, bit_idx = data[0], int(data[2])
-            byte_val = _low_byte(raw) if byte_sel == "LB" else _high_byte(raw)
-            actual = str(_bit(byte_val, bit_idx))
-            hit = actual in match_vals
-            result = view.get("value", ["1"])[0] if hit else view.get("else-value", ["0"])[0]
-            return f"{item}: {result}  (bit {bit_idx} of {'LB' if byte_sel == 'LB' else 'HB'} = {actual})"
+            return "check"
+
+    ret = view.get("return")
+    if ret and isinstance(ret, list):
+        t0 = ret[0]
+        if t0 in ("LB", "HB"):
+            if len(ret) == 3 and ret[1] == "flag8":
+                return t0
+        elif t0 in ("u16", "s16", "u8", "temp"):
+            return t0
+    return "raw"
+
+
+# View kind -> decoder factory
+_COMPILERS = {
+    "u16": _compile_u16,
+    "s16": _compile_s16,
+    "u8": _compile_u8,
+    "temp": _compile_temp,
+    "LB": _compile_flag8,
+    "HB": _compile_flag8,
+    "check": _compile_check,
+    "raw": _compile_raw,
+}
+
+
+def compile_view(view: dict) -> Decoder:
+    """Build a decoder for a single view entry, specialised to its constants.
+
+    The view's item name and return tag are interned on the way, so later
+    tag and FAULT_CODE_ITEMS comparisons mostly resolve on identity.
+    """
+    ret = view.get("return")
+    if isinstance(ret, list) and ret and isinstance(ret[0], str):
+        ret[0] = sys.intern(ret[0])
+    item = view.get("item")
+    if isinstance(item, str):
+        view["item"] = sys.intern(item)
+    return _COMPILERS[view_kind(view)](view, view.get("item", "?"))
+
+
+def decode_view(view: dict, raw: int) -> str:
+    """Decode a single view entry against a raw u16 Modbus register value.
+
+    The view is compiled on first use and the decoder cached on it as ``_decoder``.
+    """
+    decoder = view.get("_decoder")
+    if decoder is None:
+        decoder = view["_decoder"] = compile_view(view)
+    return decoder(raw)
+
+
+# ---------------------------------------------------------------------------
+# Bulk decoding (NumPy optional)
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _frame_struct(count: int, code: str):
+    """Precompiled big-endian struct.Struct for ``count`` registers of type ``code`` (H/h)."""
+    import struct
+
+    return struct.Struct(f">{count}{code}")
+
+
+def unpack_registers(buf, signed: bool = False) -> tuple[int, ...]:
+    """Split a big-endian register frame (e.g. a Modbus read payload) into u16/s16 values."""
+    if len(buf) % 2:
+        raise ValueError(f"register frame has odd length {len(buf)}")
+    return _frame_struct(len(buf) // 2, "h" if signed else "H").unpack_from(buf)
+
 
-    # ---- explicit return type ---------------------------------------------
-    if ret:
-        if isinstance(ret, list):
-            t0 = ret[0]
+@functools.lru_cache(maxsize=None)
+def _load_kernels():
+    """Import decode_kernels.py from next to this file, whether or not tools/ is on sys.path."""
+    import importlib.util
 
-            if t0 == "u16":
-                return f"{item}: {raw}  (u16)"
+    spec = importlib.util.spec_from_file_location(
+        "decode_kernels", Path(__file__).with_name("decode_kernels.py")
+    )
+    mod = importlib.util.module_from_spec(spec)
+    # Numba's on-disk cache re-imports the module by name when loading kernels
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _group_indices(views: list[dict]) -> dict[str, list[int]]:
+    """Group view positions by view kind."""
+    groups: dict[str, list[int]] = {}
+    for i, v in enumerate(views):
+        groups.setdefault(view_kind(v), []).append(i)
+    return groups
+
+
+def _group_by_type(views: list[dict]) -> dict:
+    """Group view positions by view kind, as ``{kind: index array}``."""
+    import numpy as np
 
-            if t0 == "s16":
-                signed = raw if raw < 0x8000 else raw - 0x10000
-                return f"{item}: {signed}  (s16)"
+    return {kind: np.array(idx, dtype=np.intp) for kind, idx in _group_indices(views).items()}
 
-            if t0 == "u8":
-                return f"{item}: {raw & 0xFF}  (u8)"
 
-            if t0 == "temp":
-                dec = view.get("decimal", 1)
-                scale = 10 ** (-int(dec))
-                return f"{item}: {raw * scale:.{int(dec)}f} °C  (temp, ×{scale})"
+def _check_lengths(views: list[dict], raws) -> None:
+    if len(raws) != len(views):
+        raise ValueError(f"got {len(views)} views but {len(raws)} raw values")
 
-            if t0 == "LB" and len(ret) == 3 and ret[1] == "flag8":
-                bit_idx = int(ret[2])
-                byte_val = _low_byte(raw)
-                return f"{item}: bit {bit_idx} of LB = {_bit(byte_val, bit_idx)}"
 
-            if t0 == "HB" and len(ret) == 3 and ret[1] == "flag8":
-                bit_idx = int(ret[2])
-                byte_val = _high_byte(raw)
-                return f"{item}: bit {bit_idx} of HB = {_bit(byte_val, bit_idx)}"
+def decode_many_struct(views: list[dict], raws) -> list[float]:
+    """NumPy-free counterpart of decode_many(), returning a list of floats.
 
-    # ---- fallback: show raw -----------------------------------------------
-    return f"{item}: {raw}  (raw u16)"
+    ``raws`` is a sequence of u16 values or a big-endian register frame
+    (bytes). Each s16 group is sign-extended with one struct pack/unpack.
+    """
+    if isinstance(raws, (bytes, bytearray, memoryview)):
+        raws = unpack_registers(raws)
+    _check_lengths(views, raws)
+
+    values = [0.0] * len(views)
+    for kind, idx in _group_indices(views).items():
+        sub = [raws[i] for i in idx]
+        if kind == "s16":
+            vals = _frame_struct(len(sub), "h").unpack(_frame_struct(len(sub), "H").pack(*sub))
+        elif kind == "u8":
+            vals = [r & 0xFF for r in sub]
+        elif kind == "temp":
+            vals = [r * _temp_scale(views[i])[0] for i, r in zip(idx, sub)]
+        elif kind in ("LB", "HB", "check"):
+            vals = []
+            for i, r in zip(idx, sub):
+                _, shift, bit_idx = _bit_select(views[i], kind)
+                vals.append((((r >> shift) & 0xFF) >> bit_idx) & 1)
+        else:  # u16 / raw
+            vals = sub
+        for i, v in zip(idx, vals):
+            values[i] = float(v)
+    return values
+
+
+def decode_many(views: list[dict], raws):
+    """Decode many views at once with NumPy; ``views[i]`` is decoded against ``raws[i]``.
+
+    ``raws`` is a sequence/array of u16 values or a big-endian register frame
+    (bytes). Returns a float64 ndarray of numeric values (temperatures scaled,
+    flags as 0/1), computed with one vector expression per view kind; format
+    the few values you print with decode_view(). The kernels in
+    decode_kernels.py are JIT-compiled when Numba is installed. Requires
+    NumPy; see decode_many_struct() for a NumPy-free variant.
+    """
+    import numpy as np
+
+    if isinstance(raws, (bytes, bytearray, memoryview)):
+        if len(raws) % 2:
+            raise ValueError(f"register frame has odd length {len(raws)}")
+        raws = np.frombuffer(raws, dtype=">u2").astype(np.uint16)
+    else:
+        raws = np.asarray(raws, dtype=np.uint16)
+    _check_lengths(views, raws)
+
+    kernels = _load_kernels()
+
+    values = np.empty(len(views), dtype=np.float64)
+    for kind, idx in _group_by_type(views).items():
+        sub = raws[idx]
+        if kind == "s16":
+            values[idx] = kernels._decode_s16_array(sub)
+        elif kind == "u8":
+            values[idx] = sub & 0xFF
+        elif kind == "temp":
+            scales = np.array([_temp_scale(views[i])[0] for i in idx], dtype=np.float64)
+            values[idx] = kernels._decode_temp_array(sub, scales)
+        elif kind in ("LB", "HB", "check"):
+            sel = [_bit_select(views[i], kind) for i in idx]
+            shifts = np.array([s[1] for s in sel], dtype=np.int64)
+            bits = np.array([s[2] for s in sel], dtype=np.int64)
+            values[idx] = kernels._decode_flag8_array(sub, shifts, bits)
+        else:  # u16 / raw
+            values[idx] = sub
+    return values
 
 
 # ---------------------------------------------------------------------------
 # Fault-code label lookup
 # ---------------------------------------------------------------------------
 
-FAULT_CODE_ITEMS = {"mb-functional-log", "mb-anomaly", "mb-error", "mb-fault"}
+FAULT_CODE_ITEMS = frozenset(map(sys.intern, ("mb-functional-log", "mb-anomaly", "mb-error", "mb-fault")))
 
 
-def maybe_fault_label(pdu_entry: dict, raw: int, labels: dict) -> str | None:
-    """
-    If this PDU looks like a fault-code register, return the label text.
-    Returns None if not applicable.
-    """
-    for v in pdu_entry.get("views", []):
+def is_fault_code_pdu(pdu_entry: dict) -> bool:
+    """Return True if any view of this PDU looks like a fault-code register."""
+    for v in pdu_entry.get("views", ()):
         item = v.get("item", "")
         ret = v.get("return", [])
         if item in FAULT_CODE_ITEMS or (
             "log" in item and isinstance(ret, list) and ret and ret[0] == "u16"
         ):
-            label = labels.get(raw) or labels.get("default")
-            if label:
-                return (
-                    f"  Fault code {raw}: {label['text1']}\n"
-                    f"    Detail : {label['text2']}\n"
-                    f"    Action : {label['action']}"
-                )
-    return None
+            return True
+    return False
+
+
+def maybe_fault_label(pdu_entry: dict, raw: int, lang: str) -> str | None:
+    """
+    If this PDU looks like a fault-code register, return the label text.
+    Returns None if not applicable. Labels are only loaded for fault-code PDUs.
+    """
+    is_fault = pdu_entry.get("_is_fault_code")
+    if is_fault is None:
+        is_fault = pdu_entry["_is_fault_code"] = is_fault_code_pdu(pdu_entry)
+    if not is_fault:
+        return None
+
+    labels = load_labels(lang)
+    label = labels.get(raw) or labels.get("default")
+    if not label:
+        return None
+    return (
+        f"  Fault code {raw}: {label['text1']}\n"
+        f"    Detail : {label['text2']}\n"
+        f"    Action : {label['action']}"
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -142,21 +394,23 @@ def maybe_fault_label(pdu_entry: dict, raw: int, labels: dict) -> str | None:
 
 def cmd_summary(data: dict) -> None:
     pdus = data.get("pdus", [])
-    writable = [p for p in pdus if any(m.get("action") == "write" for m in p.get("messages", []))]
-    read_only = [p for p in pdus if not any(m.get("action") == "write" for m in p.get("messages", []))]
-    empty = [p for p in pdus if not p.get("views") and not p.get("commands")]
+    out: list[str] = []
 
-    print(f"Generated : {data.get('generated_at', 'unknown')}")
-    print(f"Total PDUs: {len(pdus)}")
-    print(f"  Writable : {len(writable)}")
-    print(f"  Read-only: {len(read_only)}")
-    print(f"  Empty    : {len(empty)}  (no views/commands — PDU exists in CFG but has no decoded fields)")
-    print()
-
-    # Return-type distribution
-    type_counts: dict[str, int] = {}
+    # Single pass: counters, return-type distribution and table rows together
+    n_write = n_ro = n_empty = 0
+    type_counts: Counter[str] = Counter()
+    rows = []
     for p in pdus:
-        for v in p.get("views", []):
+        views = p.get("views", ())
+        is_write = any(m.get("action") == "write" for m in p.get("messages", ()))
+        if is_write:
+            n_write += 1
+        else:
+            n_ro += 1
+        if not views and not p.get("commands"):
+            n_empty += 1
+
+        for v in views:
             ret = v.get("return")
             check = v.get("check")
             if check and len(check.get("data", [])) >= 2 and check["data"][1] == "flag8":
@@ -165,27 +419,36 @@ def cmd_summary(data: dict) -> None:
                 t = ret[0]
             else:
                 t = "unknown"
-            type_counts[t] = type_counts.get(t, 0) + 1
+            type_counts[t] += 1
+
+        items = ", ".join(v.get("item", "?") for v in views) or "(no views)"
+        rows.append((p["pdu"], "RW" if is_write else "R", len(views), items))
 
-    print("View return-type distribution:")
+    out.append(f"Generated : {data.get('generated_at', 'unknown')}")
+    out.append(f"Total PDUs: {len(pdus)}")
+    out.append(f"  Writable : {n_write}")
+    out.append(f"  Read-only: {n_ro}")
+    out.append(f"  Empty    : {n_empty}  (no views/commands — PDU exists in CFG but has no decoded fields)")
+    out.append("")
+
+    # Return-type distribution
+    out.append("View return-type distribution:")
     for t, n in sorted(type_counts.items(), key=lambda x: -x[1]):
-        print(f"  {t:<12} {n}")
-    print()
+        out.append(f"  {t:<12} {n}")
+    out.append("")
 
-    # PDU address range
-    addrs = [p["pdu"] for p in pdus]
-    print(f"PDU address range: {min(addrs)} – {max(addrs)}")
-    print()
+    # PDU address range (rows follow the registry, which is in address order)
+    assert all(a[0] <= b[0] for a, b in zip(rows, rows[1:])), "registry PDUs are not in address order"
+    out.append(f"PDU address range: {rows[0][0]} – {rows[-1][0]}")
+    out.append("")
 
     # Show a short table of all PDUs
-    print(f"{'PDU':>6}  {'R/W':<4}  {'Views':>5}  Items")
-    print("-" * 60)
-    for p in sorted(pdus, key=lambda x: x["pdu"]):
-        rw = "RW" if any(m.get("action") == "write" for m in p.get("messages", [])) else "R"
-        items = ", ".join(
-            v.get("item", "?") for v in p.get("views", [])
-        ) or "(no views)"
-        print(f"{p['pdu']:>6}  {rw:<4}  {len(p.get('views', [])):>5}  {items}")
+    out.append(f"{'PDU':>6}  {'R/W':<4}  {'Views':>5}  Items")
+    out.append("-" * 60)
+    for addr, rw, n_views, items in rows:
+        out.append(f"{addr:>6}  {rw:<4}  {n_views:>5}  {items}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -193,32 +456,34 @@ def cmd_summary(data: dict) -> None:
 # ---------------------------------------------------------------------------
 
 def cmd_decode(data: dict, pdu_addr: int, raw: int, lang: str) -> None:
-    pdus = {p["pdu"]: p for p in data.get("pdus", [])}
-    if pdu_addr not in pdus:
+    # One lookup per run: a scan is cheaper than building an address index
+    entry = next((p for p in data.get("pdus", []) if p["pdu"] == pdu_addr), None)
+    if entry is None:
         print(f"PDU {pdu_addr} not found in registry.", file=sys.stderr)
         sys.exit(1)
 
-    entry = pdus[pdu_addr]
-    labels = load_labels(lang)
+    out: list[str] = []
 
-    print(f"PDU {pdu_addr}  raw=0x{raw:04X} ({raw})")
-    print(f"  Writable: {any(m.get('action') == 'write' for m in entry.get('messages', []))}")
-    print()
+    out.append(f"PDU {pdu_addr}  raw=0x{raw:04X} ({raw})")
+    out.append(f"  Writable: {any(m.get('action') == 'write' for m in entry.get('messages', []))}")
+    out.append("")
 
     views = entry.get("views", [])
     if not views:
-        print("  (no view definitions — cannot decode further)")
+        out.append("  (no view definitions — cannot decode further)")
     else:
-        print("  Decoded views:")
+        out.append("  Decoded views:")
         for v in views:
-            print(f"    {decode_view(v, raw)}")
+            out.append(f"    {decode_view(v, raw)}")
 
     # Fault code overlay
-    fault_text = maybe_fault_label(entry, raw, labels)
+    fault_text = maybe_fault_label(entry, raw, lang)
     if fault_text:
-        print()
-        print("  Fault label lookup:")
-        print(fault_text)
+        out.append("")
+        out.append("  Fault label lookup:")
+        out.append(fault_text)
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -241,7 +506,7 @@ def main() -> None:
         print("Run extract_registers.py first.", file=sys.stderr)
         sys.exit(1)
 
-    data = json.loads(JSON_PATH.read_text(encoding="utf8"))
+    data = load_registry()
 
     if args.pdu is not None and args.value is not None:
         cmd_decode(data, args.pdu, args.value, args.lang)